@@ -21,6 +21,9 @@ except ImportError:
 
 from .utils import (
     get_mergin_auth,
+    invalidate_local_projects_cache,
+    invalidate_mergin_auth_cache,
+    invalidate_validated_urls,
     set_mergin_auth,
     MERGIN_URL,
     create_mergin_client,
@@ -103,6 +106,8 @@ class ConfigurationDialog(QDialog):
         password = self.ui.password.text()
         settings = QSettings()
         settings.setValue("Mergin/auth_token", None)  # reset token
+        invalidate_mergin_auth_cache()
+        invalidate_validated_urls()
         settings.setValue("Mergin/saveCredentials", str(self.ui.save_credentials.isChecked()))
         settings.setValue("Mergin/username", username)
 
@@ -118,6 +123,7 @@ class ConfigurationDialog(QDialog):
                 mc = MerginClient(url, None, username, password, get_plugin_version(), proxy_config)
                 settings.setValue("Mergin/auth_token", mc._auth_session["token"])
                 settings.setValue("Mergin/server", url)
+                invalidate_local_projects_cache()
             except (URLError, ClientError, LoginError) as e:
                 QgsApplication.messageLog().logMessage(f"Mergin Maps plugin: {str(e)}")
                 mc = None
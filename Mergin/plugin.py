@@ -53,6 +53,7 @@ from .utils import (
     find_qgis_files,
     get_mergin_auth,
     icon_path,
+    invalidate_local_projects_cache,
     mm_symbol_path,
     is_number,
     login_error_message,
@@ -760,6 +761,7 @@ class MerginLocalProjectItem(QgsDirectoryItem):
 
         settings = QSettings()
         settings.remove(f"Mergin/localProjects/{self.project_name}")
+        invalidate_local_projects_cache()
         self.parent().reload()
 
     def submit_logs(self):
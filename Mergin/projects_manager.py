@@ -18,6 +18,7 @@ from .utils import (
     ErrorCode,
     InvalidProject,
     get_local_mergin_projects_info,
+    invalidate_local_projects_cache,
     LoginError,
     find_qgis_files,
     login_error_message,
@@ -169,6 +170,7 @@ class MerginProjectsManager(object):
         server_url = self.mc.url.rstrip("/")
         settings.setValue(f"Mergin/localProjects/{full_project_name}/path", project_dir)
         settings.setValue(f"Mergin/localProjects/{full_project_name}/server", server_url)
+        invalidate_local_projects_cache()
         if (
             project_dir == QgsProject.instance().absolutePath()
             or project_dir + "/" in QgsProject.instance().absolutePath()
@@ -551,6 +553,7 @@ class MerginProjectsManager(object):
             return  # either it has been cancelled or an error has been thrown
 
         settings.setValue("Mergin/localProjects/{}/path".format(project_name), target_dir)
+        invalidate_local_projects_cache()
         msg = "Your project {} has been successfully downloaded. Do you want to open project file?".format(project_name)
         btn_reply = QMessageBox.question(
             None, "Project download", msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
@@ -5,9 +5,17 @@
 
 
 import os
+import shutil
 import tempfile
 
-from qgis.core import QgsRasterLayer, QgsVectorTileLayer, QgsProviderRegistry
+from qgis.core import (
+    QgsCoordinateTransformContext,
+    QgsProviderRegistry,
+    QgsRasterLayer,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+    QgsVectorTileLayer,
+)
 
 from qgis.testing import start_app, unittest
 from Mergin.utils import package_layer
@@ -36,6 +44,19 @@ class test_packaging(unittest.TestCase):
                     destination_raster_uri = layer.dataProvider().dataSourceUri()
                     self.assertEqual(destination_raster_uri, expected_filepath)
 
+    def test_raster_in_project_subdir(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rasters_dir = os.path.join(tmp_dir, "rasters")
+            os.mkdir(rasters_dir)
+            raster_path = os.path.join(rasters_dir, "dem.tif")
+            shutil.copy(os.path.join(test_data_path, "dem.tif"), raster_path)
+            layer = QgsRasterLayer(raster_path, "test", "gdal")
+            self.assertTrue(layer.isValid())
+            # raster already in the project is neither copied nor rewritten
+            self.assertTrue(package_layer(layer, tmp_dir))
+            self.assertEqual(layer.dataProvider().dataSourceUri(), raster_path)
+            self.assertFalse(os.path.exists(os.path.join(tmp_dir, "dem.tif")))
+
     def test_mbtiles_packaging(self):
         raster_tiles_path = os.path.join(test_data_path, "raster-tiles.mbtiles")
         layer = QgsRasterLayer(f"url=file://{raster_tiles_path}&type=mbtiles", "test", "wms")
@@ -59,6 +80,25 @@ class test_packaging(unittest.TestCase):
             self.assertTrue("path" in uri)
             self.assertEqual(uri["path"], expected_path)
 
+    def test_gpkg_in_project_dir(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            gpkg_path = os.path.join(tmp_dir, "points.gpkg")
+            memory_layer = QgsVectorLayer("Point?crs=EPSG:4326&field=name:string", "points", "memory")
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = "GPKG"
+            err = QgsVectorFileWriter.writeAsVectorFormatV3(
+                memory_layer, gpkg_path, QgsCoordinateTransformContext(), options
+            )
+            self.assertEqual(err[0], QgsVectorFileWriter.NoError)
+
+            layer = QgsVectorLayer(gpkg_path, "points", "ogr")
+            self.assertTrue(layer.isValid())
+            source = layer.source()
+            # GPKG already in the project dir is used as it is, no copy is made
+            self.assertTrue(package_layer(layer, tmp_dir))
+            self.assertEqual(layer.source(), source)
+            self.assertEqual([f for f in os.listdir(tmp_dir) if f.endswith(".gpkg")], ["points.gpkg"])
+
 
 if __name__ == "__main__":
     nose2.main()
@@ -20,7 +20,7 @@ from qgis.core import (
 )
 
 from qgis.testing import start_app, unittest
-from Mergin.utils import same_schema, get_datum_shift_grids, is_valid_name, create_tracking_layer
+from Mergin.utils import same_schema, get_datum_shift_grids, is_valid_name, create_tracking_layer, get_unique_filename
 
 test_data_path = os.path.join(os.path.dirname(__file__), "data")
 
@@ -201,6 +201,34 @@ class test_utils(unittest.TestCase):
             self.assertEqual(fields[4].name(), "tracked_by")
             self.assertEqual(fields[4].type(), QVariant.String)
 
+    def test_unique_filename(self):
+        def touch(path):
+            with open(path, "w"):
+                pass
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "data.gpkg")
+            self.assertEqual(get_unique_filename(filename), filename)
+            touch(filename)
+
+            # numbered copies 1..n exist, the next number is used
+            copies = 0
+            for expected in (1, 2, 4, 5, 6, 8, 9, 10):
+                while copies < expected - 1:
+                    copies += 1
+                    touch(os.path.join(temp_dir, f"data_{copies}.gpkg"))
+                self.assertEqual(get_unique_filename(filename), os.path.join(temp_dir, f"data_{expected}.gpkg"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "data.gpkg")
+            touch(filename)
+            for i in (1, 2, 4, 5, 6, 7):
+                touch(os.path.join(temp_dir, f"data_{i}.gpkg"))
+            # with a gap in the numbers the result is a free number, but not necessarily the lowest one
+            self.assertEqual(get_unique_filename(filename), os.path.join(temp_dir, "data_8.gpkg"))
+            os.remove(os.path.join(temp_dir, "data_4.gpkg"))
+            self.assertEqual(get_unique_filename(filename), os.path.join(temp_dir, "data_3.gpkg"))
+
 
 if __name__ == "__main__":
     nose2.main()
@@ -6,10 +6,14 @@
 
 import os
 import base64
+import tempfile
 
 from qgis.PyQt.QtCore import QVariant
 
 from qgis.core import (
+    QgsCoordinateTransformContext,
+    QgsFeature,
+    QgsVectorFileWriter,
     QgsVectorLayer,
     QgsField,
     QgsEditorWidgetSetup,
@@ -25,7 +29,6 @@ from qgis.testing import start_app, unittest
 from Mergin.validation import MerginProjectValidator, Warning, SingleLayerWarning
 from Mergin.utils import TILES_URL
 
-
 test_data_path = os.path.join(os.path.dirname(__file__), "data")
 
 
@@ -48,7 +51,7 @@ class test_validations(unittest.TestCase):
 
         validator = MerginProjectValidator()
         validator.layers = {"mem_1": layer}
-        validator.editable = ["mem_1"]
+        validator.editable = {"mem_1"}
 
         # absolute path
         config = {
@@ -129,6 +132,66 @@ class test_validations(unittest.TestCase):
         self.assertEqual(issue.warning, Warning.ATTACHMENT_WRONG_EXPRESSION)
         validator.issues = []
 
+    def test_attachment_widget_duplicates(self):
+        layer = QgsVectorLayer("Point", "test", "memory")
+        fields = [QgsField("photo", QVariant.String), QgsField("document", QVariant.String)]
+        layer.dataProvider().addAttributes(fields)
+        layer.updateFields()
+
+        validator = MerginProjectValidator()
+        validator.layers = {"mem_1": layer}
+        validator.editable = {"mem_1"}
+
+        # both fields use the same absolute path configuration
+        config = {
+            "PropertyCollection": {"name": None, "properties": {}, "type": "collection"},
+            "RelativeStorage": 0,
+            "StorageMode": 0,
+        }
+        layer.setEditorWidgetSetup(0, QgsEditorWidgetSetup("ExternalResource", config))
+        layer.setEditorWidgetSetup(1, QgsEditorWidgetSetup("ExternalResource", config))
+        validator.check_attachment_widget()
+        self.assertEqual(len(validator.issues), 1)
+        self.assertEqual(validator.issues[0].layer_id, "mem_1")
+        self.assertEqual(validator.issues[0].warning, Warning.ATTACHMENT_ABSOLUTE_PATH)
+
+        # the warning is reported again once the issues were cleared
+        validator.issues = []
+        validator.check_attachment_widget()
+        self.assertEqual(len(validator.issues), 1)
+        self.assertEqual(validator.issues[0].warning, Warning.ATTACHMENT_ABSOLUTE_PATH)
+
+    def test_relation_fields_duplicates(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            memory_layer = QgsVectorLayer("Point?crs=EPSG:4326&field=name:string", "points", "memory")
+            features = []
+            for _ in range(2):
+                f = QgsFeature(memory_layer.fields())
+                f.setAttribute("name", "same")
+                features.append(f)
+            memory_layer.dataProvider().addFeatures(features)
+
+            gpkg_path = os.path.join(tmp_dir, "points.gpkg")
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = "GPKG"
+            err = QgsVectorFileWriter.writeAsVectorFormatV3(
+                memory_layer, gpkg_path, QgsCoordinateTransformContext(), options
+            )
+            self.assertEqual(err[0], QgsVectorFileWriter.NoError)
+            layer = QgsVectorLayer(gpkg_path, "points", "ogr")
+            self.assertTrue(layer.isValid())
+            fid_idx = layer.fields().indexFromName("fid")
+            name_idx = layer.fields().indexFromName("name")
+
+            # the same fields used by two relations are reported only once
+            validator = MerginProjectValidator()
+            for _ in range(2):
+                validator._check_field_unique(layer, [name_idx])
+                validator._check_primary_keys(layer, [fid_idx])
+            warnings = [issue.warning for issue in validator.issues]
+            self.assertEqual(warnings, [Warning.KEY_FIELD_NOT_UNIQUE, Warning.FIELD_IS_PRIMARY_KEY])
+            self.assertTrue(all(issue.layer_id == layer.id() for issue in validator.issues))
+
     def test_embedded_svg(self):
         layer = QgsVectorLayer("Point", "test", "memory")
         symbol = QgsMarkerSymbol()
@@ -138,7 +201,7 @@ class test_validations(unittest.TestCase):
 
         validator = MerginProjectValidator()
         validator.layers = {"mem_1": layer}
-        validator.editable = ["mem_1"]
+        validator.editable = {"mem_1"}
 
         validator.check_svgs_embedded()
         self.assertTrue(len(validator.issues) == 1)
@@ -159,7 +222,7 @@ class test_validations(unittest.TestCase):
         layer.renderer().setSymbol(symbol)
 
         validator.layers = {"mem_1": layer}
-        validator.editable = ["mem_1"]
+        validator.editable = {"mem_1"}
         validator.check_svgs_embedded()
         self.assertTrue(len(validator.issues) == 0)
 
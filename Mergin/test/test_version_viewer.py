@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+# GPLv3 license
+# Copyright Lutra Consulting Limited
+
+
+import os
+import tempfile
+
+from qgis.testing import start_app, unittest
+from Mergin.version_viewer_dialog import VersionsCache
+
+
+def version(number):
+    return {"name": f"v{number}", "author": "user", "created": "2024-01-01T00:00:00Z"}
+
+
+class test_version_viewer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        start_app()
+
+    def test_versions_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = VersionsCache(os.path.join(temp_dir, ".cache", "versions.sqlite"))
+
+            # empty database
+            self.assertEqual(cache.versions_below(10), [])
+
+            # v1-v3 and v5-v8 cached, v4 missing
+            cache.insert_versions([version(i) for i in (1, 2, 3, 5, 6, 7, 8)])
+
+            # contiguous run down to v1
+            self.assertEqual([v["name"] for v in cache.versions_below(4)], ["v3", "v2", "v1"])
+            self.assertEqual(cache.versions_below(4)[0], version(3))
+
+            # stops at the first gap
+            self.assertEqual([v["name"] for v in cache.versions_below(9)], ["v8", "v7", "v6", "v5"])
+
+            # preceding version not cached
+            self.assertEqual(cache.versions_below(5), [])
+            self.assertEqual(cache.versions_below(10), [])
+            self.assertEqual(cache.versions_below(1), [])
+
+
+if __name__ == "__main__":
+    nose2.main()
@@ -1,11 +1,15 @@
 # GPLv3 license
 # Copyright Lutra Consulting Limited
 
+import contextlib
+import io
+import itertools
 import shutil
 from datetime import datetime, timezone, tzinfo
 from enum import Enum
+from functools import lru_cache
+import gzip
 from urllib.error import URLError, HTTPError
-import configparser
 import os
 from osgeo import gdal
 import pathlib
@@ -68,6 +72,9 @@ from qgis.core import (
 from .mergin.utils import int_version, bytes_to_human_size
 from .mergin.merginproject import MerginProject
 
+PLUGIN_DIR = os.path.dirname(os.path.realpath(__file__))
+IMAGES_DIR = os.path.join(PLUGIN_DIR, "images")
+
 try:
     from .mergin.common import ClientError, ErrorCode, LoginError, InvalidProject
     from .mergin.client import MerginClient, ServerType
@@ -94,8 +101,7 @@ try:
 except ImportError:
     import sys
 
-    this_dir = os.path.dirname(os.path.realpath(__file__))
-    path = os.path.join(this_dir, "mergin_client.whl")
+    path = os.path.join(PLUGIN_DIR, "mergin_client.whl")
     sys.path.append(path)
     from mergin.client import MerginClient, ServerType
     from mergin.common import ClientError, InvalidProject, LoginError
@@ -124,22 +130,26 @@ except ImportError:
 MERGIN_URL = "https://app.merginmaps.com"
 MERGIN_LOGS_URL = "https://g4pfq226j0.execute-api.eu-west-1.amazonaws.com/mergin_client_log_submit"
 
-QGIS_NET_PROVIDERS = ("WFS", "arcgisfeatureserver", "arcgismapserver", "geonode", "ows", "wcs", "wms", "vectortile")
-QGIS_DB_PROVIDERS = ("postgres", "mssql", "oracle", "hana", "postgresraster", "DB2")
-QGIS_MESH_PROVIDERS = ("mdal", "mesh_memory")
-QGIS_FILE_BASED_PROVIDERS = (
-    "ogr",
-    "gdal",
-    "spatialite",
-    "delimitedtext",
-    "gpx",
-    "mdal",
-    "grass",
-    "grassraster",
-    "wms",
-    "vectortile",
+QGIS_NET_PROVIDERS = frozenset(
+    {"WFS", "arcgisfeatureserver", "arcgismapserver", "geonode", "ows", "wcs", "wms", "vectortile"}
+)
+QGIS_DB_PROVIDERS = frozenset({"postgres", "mssql", "oracle", "hana", "postgresraster", "DB2"})
+QGIS_MESH_PROVIDERS = frozenset({"mdal", "mesh_memory"})
+QGIS_FILE_BASED_PROVIDERS = frozenset(
+    {
+        "ogr",
+        "gdal",
+        "spatialite",
+        "delimitedtext",
+        "gpx",
+        "mdal",
+        "grass",
+        "grassraster",
+        "wms",
+        "vectortile",
+    }
 )
-PACKABLE_PROVIDERS = ("ogr", "gdal", "delimitedtext", "gpx", "postgres", "memory")
+PACKABLE_PROVIDERS = frozenset({"ogr", "gdal", "delimitedtext", "gpx", "postgres", "memory"})
 
 PROJS_PER_PAGE = 50
 
@@ -205,17 +215,33 @@ class FieldConverter(QgsVectorFileWriter.FieldValueConverter):
         return value
 
 
-def find_qgis_files(directory):
-    qgis_files = []
-    for root, dirs, files in os.walk(directory):
-        for f in files:
-            _, ext = os.path.splitext(f)
-            if ext in [".qgs", ".qgz"]:
-                qgis_files.append(os.path.join(root, f))
-    return qgis_files
+def find_qgis_files(directory, limit=None):
+    """Returns paths of QGIS project files in the directory, the scan stops once limit files were found."""
+
+    def scan(d):
+        # like os.walk, unreadable directories are skipped
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from scan(entry.path)
+                    elif entry.name.endswith((".qgs", ".qgz")):
+                        yield entry.path
+        except OSError:
+            return
+
+    return list(itertools.islice(scan(directory), limit))
+
+
+# credentials loaded from the QGIS auth database, decrypting them on every call is not cheap
+_AUTH_CACHE = None
 
 
 def get_mergin_auth():
+    global _AUTH_CACHE
+    if _AUTH_CACHE is not None:
+        return _AUTH_CACHE
+
     settings = QSettings()
     save_credentials = settings.value("Mergin/saveCredentials", "false").lower() == "true"
     mergin_url = settings.value("Mergin/server", MERGIN_URL)
@@ -225,14 +251,24 @@ def get_mergin_auth():
 
     authcfg = settings.value("Mergin/authcfg", None)
     cfg = QgsAuthMethodConfig()
-    auth_manager.loadAuthenticationConfig(authcfg, cfg, True)
+    loaded = auth_manager.loadAuthenticationConfig(authcfg, cfg, True)
     url = cfg.uri()
     username = cfg.config("username")
     password = cfg.config("password")
+    # do not remember a failed load (e.g. the master password prompt was cancelled), so that the next call asks again
+    if loaded and url:
+        _AUTH_CACHE = url, username, password
     return url, username, password
 
 
+def invalidate_mergin_auth_cache():
+    """Forget the cached credentials, needs to be called whenever the Mergin Maps auth settings change"""
+    global _AUTH_CACHE
+    _AUTH_CACHE = None
+
+
 def set_mergin_auth(url, username, password):
+    invalidate_mergin_auth_cache()
     settings = QSettings()
     authcfg = settings.value("Mergin/authcfg", None)
     cfg = QgsAuthMethodConfig()
@@ -255,6 +291,8 @@ def set_mergin_auth(url, username, password):
         settings.setValue("Mergin/authcfg", cfg.id())
 
     settings.setValue("Mergin/server", url)
+    # projects without a server fall back to the configured one
+    invalidate_local_projects_cache()
 
 
 def get_qgis_proxy_config(url=None):
@@ -322,9 +360,10 @@ def create_mergin_client():
         QgsApplication.messageLog().logMessage(str(e))
         raise
     settings.setValue("Mergin/auth_token", mc._auth_session["token"])
-    return MerginClient(url, mc._auth_session["token"], username, password, get_plugin_version(), proxy_config)
+    return mc
 
 
+@lru_cache(maxsize=1)
 def get_qgis_version_str():
     """Returns QGIS verion as 'MAJOR.MINOR.PATCH', for example '3.10.6'"""
     # there's also Qgis.QGIS_VERSION which is string but also includes release name (possibly with unicode characters)
@@ -335,13 +374,15 @@ def get_qgis_version_str():
     return "{}.{}.{}".format(qgis_ver_major, qgis_ver_minor, qgis_ver_patch)
 
 
+@lru_cache(maxsize=1)
 def plugin_version():
-    with open(os.path.join(os.path.dirname(__file__), "metadata.txt"), "r") as f:
-        config = configparser.ConfigParser()
-        config.read_file(f)
-    return config["general"]["version"]
+    # only the version is needed, so look it up directly instead of parsing the whole file
+    with open(os.path.join(PLUGIN_DIR, "metadata.txt"), "r") as f:
+        match = re.search(r"^version\s*=\s*(.+)$", f.read(), re.MULTILINE)
+    return match.group(1).strip()
 
 
+@lru_cache(maxsize=1)
 def get_plugin_version():
     version = plugin_version()
     return "Plugin/" + version + " QGIS/" + get_qgis_version_str()
@@ -355,9 +396,16 @@ def is_versioned_file(file):
     :returns: if file is compatible with geodiff lib
     :rtype: bool
     """
-    diff_extensions = [".gpkg", ".sqlite"]
-    f_extension = os.path.splitext(file)[1]
-    return f_extension in diff_extensions
+    return file.lower().endswith((".gpkg", ".sqlite"))
+
+
+def copy_file_tail(path, out, max_size):
+    """Write at most the last max_size bytes of the file to the out file object"""
+    size = os.stat(path).st_size
+    with open(path, "rb") as f:
+        if size > max_size:
+            f.seek(-max_size, os.SEEK_END)
+        shutil.copyfileobj(f, out, 64 * 1024)
 
 
 def send_logs(username, logfile):
@@ -380,19 +428,19 @@ def send_logs(username, logfile):
         version, get_qgis_version_str(), system, mergin_url, username
     )
 
-    global_logs = b""
-    if global_log_file and os.path.exists(global_log_file):
-        with open(global_log_file, "rb") as f:
-            if os.path.getsize(global_log_file) > 100 * 1024:
-                f.seek(-100 * 1024, os.SEEK_END)
-            global_logs = f.read() + b"\n--------------------------------\n\n"
-
-    with open(logfile, "rb") as f:
-        if os.path.getsize(logfile) > 512 * 1024:
-            f.seek(-512 * 1024, os.SEEK_END)
-        logs = f.read()
-
-    payload = meta.encode() + global_logs + logs
+    # logs compress very well, which matters on slow uplinks
+    compress = QSettings().value("Mergin/compressLogs", True, type=bool)
+    body = io.BytesIO()
+    # the log tails are streamed into the request body rather than read into memory first
+    with gzip.GzipFile(fileobj=body, mode="wb", compresslevel=6) if compress else contextlib.nullcontext(body) as out:
+        out.write(meta.encode())
+        if global_log_file and os.path.exists(global_log_file):
+            copy_file_tail(global_log_file, out, 100 * 1024)
+            out.write(b"\n--------------------------------\n\n")
+        copy_file_tail(logfile, out, 512 * 1024)
+    payload = body.getvalue()
+    if compress:
+        header["content-encoding"] = "gzip"
     try:
         req = urllib.request.Request(url, data=payload, headers=header)
         resp = urllib.request.urlopen(req)
@@ -404,12 +452,18 @@ def send_logs(username, logfile):
         return None, str(e)
 
 
+# URLs already validated as Mergin Maps servers, failures are not kept so that the user can retry
+_VALID_MERGIN_URLS = set()
+
+
 def validate_mergin_url(url):
     """
     Initiates connection to the provided server URL to check if the server is accessible
     :param url: String Mergin Maps URL to ping.
     :return: String error message as result of validation. If None, URL is valid.
     """
+    if url in _VALID_MERGIN_URLS:
+        return None
     try:
         MerginClient(url, proxy_config=get_qgis_proxy_config(url))
 
@@ -419,16 +473,29 @@ def validate_mergin_url(url):
     # Cannot parse URL
     except ValueError:
         return "Invalid URL"
+    _VALID_MERGIN_URLS.add(url)
     return None
 
 
+def invalidate_validated_urls():
+    """Forget the URLs validated by validate_mergin_url(), e.g. when the server configuration is saved"""
+    _VALID_MERGIN_URLS.clear()
+
+
 def same_dir(dir1, dir2):
     """Check if the two directory are the same."""
     if not dir1 or not dir2:
         return False
-    path1 = pathlib.Path(dir1)
-    path2 = pathlib.Path(dir2)
-    return path1 == path2
+    return os.path.normcase(os.path.normpath(dir1)) == os.path.normcase(os.path.normpath(dir2))
+
+
+def is_in_dir(path, directory):
+    """Check if the path is the directory itself or anything inside it."""
+    if not path or not directory:
+        return False
+    path = os.path.normcase(os.path.normpath(path))
+    directory = os.path.normcase(os.path.normpath(directory))
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
 
 
 def get_new_qgis_project_filepath(project_name=None):
@@ -462,31 +529,26 @@ def unsaved_project_check():
     :return: UnsavedChangesStrategy enumerator defining if previous method should continue
     :type: Enum
     """
-    if (
-        any(
-            [
-                type(layer) is QgsVectorLayer and layer.isModified()
-                for layer in QgsProject.instance().mapLayers().values()
-            ]
-        )
-        or QgsProject.instance().isDirty()
-    ):
+    project = QgsProject.instance()
+    modified_layers = [
+        layer for layer in project.mapLayers().values() if type(layer) is QgsVectorLayer and layer.isModified()
+    ]
+    if modified_layers or project.isDirty():
         msg = "There are some unsaved changes. Do you want save them before continue?"
         btn_reply = QMessageBox.warning(
             None, "Unsaved changes", msg, QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
         )
         if btn_reply == QMessageBox.Yes:
-            for layer in QgsProject.instance().mapLayers().values():
-                if type(layer) is QgsVectorLayer and layer.isModified():
-                    layer.commitChanges()
-            if QgsProject.instance().isDirty():
-                if QgsProject.instance().fileName():
-                    QgsProject.instance().write()
+            for layer in modified_layers:
+                layer.commitChanges()
+            if project.isDirty():
+                if project.fileName():
+                    project.write()
                 else:
                     project_file = get_new_qgis_project_filepath()
                     if project_file:
-                        QgsProject.instance().setFileName(project_file)
-                        write_ok = QgsProject.instance().write()
+                        project.setFileName(project_file)
+                        write_ok = project.write()
                         if not write_ok:
                             QMessageBox.warning(
                                 None, "Error Saving Project", "QGIS project was not saved properly. Cancelling..."
@@ -645,11 +707,19 @@ def get_unique_filename(filename):
     if not os.path.exists(filename) and os.path.exists(os.path.dirname(filename)):
         return filename
     file_path_name, ext = os.path.splitext(filename)
-    i = 1
     new_filename = f"{file_path_name}_{{}}{ext}"
-    while os.path.isfile(new_filename.format(i)):
-        i += 1
-    return new_filename.format(i)
+    # numbered copies usually form a sequence, so find a free number by doubling and then bisecting
+    # to check O(log n) names only, "lo" is always taken (or 0) and "hi" always free
+    lo, hi = 0, 1
+    while os.path.lexists(new_filename.format(hi)):
+        lo, hi = hi, hi * 2
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if os.path.lexists(new_filename.format(mid)):
+            lo = mid
+        else:
+            hi = mid
+    return new_filename.format(hi)
 
 
 def datasource_filepath(layer):
@@ -677,7 +747,7 @@ def datasource_filepath(layer):
         ds_uri = uri["path"] if "path" in uri else None
     else:
         ds_uri = None
-    return ds_uri if os.path.isfile(ds_uri) else None
+    return ds_uri if ds_uri and os.path.isfile(ds_uri) else None
 
 
 def is_layer_packable(layer):
@@ -725,26 +795,30 @@ def package_layer(layer, project_dir):
         raise PackagingError(f"{layer.name()} is not a valid QGIS layer")
 
     dp = layer.dataProvider()
+    ltype = layer.type()
     src_filepath = datasource_filepath(layer)
-    if src_filepath and same_dir(os.path.dirname(src_filepath), project_dir):
-        # layer already stored in the target project dir
-        if layer.type() in (QgsMapLayerType.RasterLayer, QgsMapLayerType.MeshLayer, QgsMapLayerType.VectorTileLayer):
-            return True
-        if layer.type() == QgsMapLayerType.VectorLayer:
+    if src_filepath:
+        src_dir = os.path.dirname(src_filepath)
+        # layer already stored in the target project dir, rasters (and other data we can only copy or rewrite
+        # as a whole) are used as they are also from its subdirs
+        if ltype in (QgsMapLayerType.RasterLayer, QgsMapLayerType.MeshLayer, QgsMapLayerType.VectorTileLayer):
+            if is_in_dir(src_dir, project_dir):
+                return True
+        elif ltype == QgsMapLayerType.VectorLayer:
             # if it is a GPKG we do not need to rewrite it
-            if dp.storageType == "GPKG":
+            if same_dir(src_dir, project_dir) and dp.storageType() == "GPKG":
                 return True
 
-    if layer.type() == QgsMapLayerType.VectorLayer:
+    if ltype == QgsMapLayerType.VectorLayer:
         fname, err = save_vector_layer_as_gpkg(layer, project_dir, update_datasource=True)
         if err:
             raise PackagingError(f"Couldn't properly save layer {layer.name()}: {err}")
-    elif layer.type() == QgsMapLayerType.VectorTileLayer:
+    elif ltype == QgsMapLayerType.VectorTileLayer:
         uri = QgsProviderRegistry.instance().decodeUri("vectortile", layer.source())
         is_local = os.path.isfile(uri["path"]) if "path" in uri else False
         if is_local:
             copy_layer_files(layer, uri["path"], project_dir)
-    elif layer.type() == QgsMapLayerType.RasterLayer:
+    elif ltype == QgsMapLayerType.RasterLayer:
         save_raster_layer(layer, project_dir)
     else:
         # everything else (meshes)
@@ -936,68 +1010,124 @@ def unhandled_exception_message(error_details, dialog_title, error_text, log_fil
     box.exec()
 
 
+MERGIN_PROJECT_VARIABLES = (
+    "mergin_project_name",
+    "mergin_project_owner",
+    "mergin_project_full_name",
+    "mergin_project_version",
+    "mergin_project_server",
+)
+
+
 def write_project_variables(project_owner, project_name, project_full_name, version, server):
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_name", project_name)
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_owner", project_owner)
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_full_name", project_full_name)
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_version", int_version(version))
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_server", server)
+    # setProjectVariables() replaces all the project variables, keep the ones not set by us
+    project = QgsProject.instance()
+    variables = project.customVariables()
+    variables.update(
+        {
+            "mergin_project_name": project_name,
+            "mergin_project_owner": project_owner,
+            "mergin_project_full_name": project_full_name,
+            "mergin_project_version": int_version(version),
+            "mergin_project_server": server,
+        }
+    )
+    QgsExpressionContextUtils.setProjectVariables(project, variables)
 
 
 def remove_project_variables():
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_name")
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_full_name")
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_version")
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_owner")
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_server")
+    project = QgsProject.instance()
+    variables = project.customVariables()
+    if not any(name in variables for name in MERGIN_PROJECT_VARIABLES):
+        return
+    for name in MERGIN_PROJECT_VARIABLES:
+        variables.pop(name, None)
+    QgsExpressionContextUtils.setProjectVariables(project, variables)
 
 
 def pretty_summary(summary):
-    msg = ""
+    parts = []
     for k, v in summary.items():
-        msg += "\nDetails " + k
-        msg += "".join(
-            "\n layer name - "
-            + d["table"]
-            + ": inserted: "
-            + str(d["insert"])
-            + ", modified: "
-            + str(d["update"])
-            + ", deleted: "
-            + str(d["delete"])
-            for d in v["geodiff_summary"]
-            if d["table"] != "gpkg_contents"
-        )
-    return msg
+        parts.append("\nDetails " + k)
+        for d in v["geodiff_summary"]:
+            if d["table"] == "gpkg_contents":
+                continue
+            parts.append(
+                f"\n layer name - {d['table']}: inserted: {d['insert']}, modified: {d['update']}, deleted: {d['delete']}"
+            )
+    return "".join(parts)
+
+
+def existing_paths(paths):
+    """
+    Return the subset of paths which exist. Paths usually share a few parent directories,
+    so each parent is listed once instead of checking every path separately.
+    """
+    by_parent = {}
+    for path in paths:
+        parent, name = os.path.split(os.path.normpath(path))
+        by_parent.setdefault(parent, []).append((os.path.normcase(name), path))
+
+    existing = set()
+    for parent, entries in by_parent.items():
+        try:
+            with os.scandir(parent or os.curdir) as it:
+                names = {os.path.normcase(entry.name) for entry in it}
+        except OSError:
+            # the parent may be traversable but not listable (e.g. a restricted share), check the paths one by one
+            existing.update(path for name, path in entries if os.path.exists(path))
+            continue
+        existing.update(path for name, path in entries if name in names)
+    return existing
+
+
+# list of local projects read from QSettings, reading and checking all of them on each call is slow
+_LOCAL_PROJECTS_CACHE = None
+
+
+def invalidate_local_projects_cache():
+    """Forget the cached local projects list, needs to be called whenever "Mergin/localProjects" settings change"""
+    global _LOCAL_PROJECTS_CACHE
+    _LOCAL_PROJECTS_CACHE = None
 
 
 def get_local_mergin_projects_info():
     """Get a list of local Mergin Maps projects info from QSettings."""
+    global _LOCAL_PROJECTS_CACHE
+    if _LOCAL_PROJECTS_CACHE is not None:
+        return _LOCAL_PROJECTS_CACHE
+
     local_projects_info = []
     settings = QSettings()
     config_server = settings.value("Mergin/server", None)
     if config_server is None:
         return local_projects_info
     settings.beginGroup("Mergin/localProjects/")
+    # Expecting key in the following form: '<namespace>/<project_name>/path'
+    # - needs project dir to load metadata
+    project_paths = []
     for key in settings.allKeys():
-        # Expecting key in the following form: '<namespace>/<project_name>/path'
-        # - needs project dir to load metadata
         key_parts = key.split("/")
         if len(key_parts) > 2 and key_parts[2] == "path":
             local_path = settings.value(key, None)
-            # double check if the path exists - it might get deleted manually
-            if local_path is None or not os.path.exists(local_path):
-                continue
-            # We also need the server the project was created for, but users may already have some projects created
-            # without the server specified. In that case, let's assume it is currently defined server and also store
-            # the info for later, when user will be able to change server config actively.
-            server_key = f"{key_parts[0]}/{key_parts[1]}/server"
-            proj_server = settings.value(server_key, None)
-            if proj_server is None:
-                proj_server = config_server
-                settings.setValue(server_key, config_server)
-            # project info = (path, project owner, project name, server)
-            local_projects_info.append((local_path, key_parts[0], key_parts[1], proj_server))
+            if local_path is not None:
+                project_paths.append((key_parts, local_path))
+    # double check if the path exists - it might get deleted manually
+    existing = existing_paths([local_path for _, local_path in project_paths])
+    for key_parts, local_path in project_paths:
+        if local_path not in existing:
+            continue
+        # We also need the server the project was created for, but users may already have some projects created
+        # without the server specified. In that case, let's assume it is currently defined server and also store
+        # the info for later, when user will be able to change server config actively.
+        server_key = f"{key_parts[0]}/{key_parts[1]}/server"
+        proj_server = settings.value(server_key, None)
+        if proj_server is None:
+            proj_server = config_server
+            settings.setValue(server_key, config_server)
+        # project info = (path, project owner, project name, server)
+        local_projects_info.append((local_path, key_parts[0], key_parts[1], proj_server))
+    _LOCAL_PROJECTS_CACHE = local_projects_info
     return local_projects_info
 
 
@@ -1007,13 +1137,15 @@ def set_qgis_project_mergin_variables():
     if not qgis_project_path:
         return None
     for local_path, owner, name, server in get_local_mergin_projects_info():
-        if same_dir(path, qgis_project_path):
+        if same_dir(local_path, qgis_project_path):
             try:
-                mp = MerginProject(path)
-                write_project_variables(owner, name, mp.project_full_name(), mp.version(), server)
-                return mp.project_full_name()
+                mp = MerginProject(local_path)
+                project_full_name = mp.project_full_name()
+                write_project_variables(owner, name, project_full_name, mp.version(), server)
+                return project_full_name
             except InvalidProject:
                 remove_project_variables()
+                return None
     return None
 
 
@@ -1031,6 +1163,7 @@ def mergin_project_local_path(project_name=None):
             if not os.path.exists(proj_path) or not check_mergin_subdirs(proj_path):
                 # project dir does not exist or is not a Mergin project anymore, let's remove it from settings
                 settings.remove(f"Mergin/localProjects/{project_name}/path")
+                invalidate_local_projects_cache()
                 proj_path = None
         return proj_path
 
@@ -1047,7 +1180,7 @@ def mergin_project_local_path(project_name=None):
 
 def icon_path(icon_filename):
     icon_set = "white" if is_dark_theme() else "default"
-    ipath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "images", icon_set, "tabler_icons", icon_filename)
+    ipath = os.path.join(IMAGES_DIR, icon_set, "tabler_icons", icon_filename)
     return ipath
 
 
@@ -1059,7 +1192,7 @@ def mm_logo_path():
         icon_set = "default"
         icon_filename = "MM_logo_HORIZ_COLOR_VECTOR.svg"
 
-    ipath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "images", icon_set, icon_filename)
+    ipath = os.path.join(IMAGES_DIR, icon_set, icon_filename)
     return ipath
 
 
@@ -1072,7 +1205,7 @@ def mm_symbol_path():
         icon_color = "COLOR"
 
     icon_filename = "MM_symbol_" + icon_color + "_no_padding.svg"
-    ipath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "images", icon_set, icon_filename)
+    ipath = os.path.join(IMAGES_DIR, icon_set, icon_filename)
     return ipath
 
 
@@ -4,7 +4,6 @@
 import os
 import re
 from enum import Enum
-from collections import defaultdict
 
 from qgis.core import (
     QgsMapLayerType,
@@ -30,6 +29,10 @@ from .utils import (
 
 INVALID_CHARS = re.compile('[\\\/\(\)\[\]\{\}"\n\r]')
 PROJECT_VARS = re.compile("\@project_home|\@project_path|\@project_folder")
+# providers whose data need a connection to a server
+ONLINE_PROVIDERS = QGIS_NET_PROVIDERS | QGIS_DB_PROVIDERS
+# vector layers whose data provider has any of these capabilities are considered editable
+EDIT_CAPABILITIES = QgsVectorDataProvider.AddFeatures | QgsVectorDataProvider.ChangeAttributeValues
 
 
 class Warning(Enum):
@@ -91,8 +94,14 @@ class MerginProjectValidator(object):
     def __init__(self, mergin_project=None, changes=None, project_permission=None):
         self.mp = mergin_project
         self.layers = None  # {layer_id: map layer}
-        self.editable = None  # list of editable layers ids
-        self.layers_by_prov = defaultdict(list)  # {provider_name: [layers]}
+        self.editable = set()  # set of editable layers ids
+        self.gdal_lids = list()  # ids of layers using the GDAL provider
+        self.ogr_lids = list()  # ids of layers using the OGR provider
+        self.providers = dict()  # {layer_id: (data provider, provider name, storage type of vector layers)}
+        self.file_layer_ids = frozenset()  # ids of layers read from files by GDAL/OGR
+        self.online_layer_ids = list()  # ids of layers which might not be available when offline
+        self.schema_changes = dict()  # {GeoPackage path: has schema change}, shared by all layers of the file
+        self.expressions_validity = dict()  # {expression string: is valid}, layers often share the same expressions
         self.issues = list()
         self.qgis_files = None
         self.qgis_proj = None
@@ -101,6 +110,18 @@ class MerginProjectValidator(object):
         self.changes = changes
         self.project_permission = project_permission
 
+    @property
+    def issues(self):
+        return self._issues
+
+    @issues.setter
+    def issues(self, issues):
+        self._issues = issues
+        # {(layer_id, warning, url)} of the reported issues, kept in sync when the issues are replaced (e.g. cleared)
+        self.single_layer_warnings = {
+            (w.layer_id, w.warning, w.url) for w in issues if isinstance(w, SingleLayerWarning)
+        }
+
     def run_checks(self):
         if self.mp is None:
             # preliminary check for current QGIS project, no Mergin project created yet
@@ -113,11 +134,7 @@ class MerginProjectValidator(object):
             return self.issues
         self.get_proj_layers()
         self.check_proj_paths_relative()
-        self.check_saved_in_proj_dir()
-        self.check_editable_vectors_format()
-        self.check_offline()
-        self.check_attachment_widget()
-        self.check_db_schema()
+        self.check_all_layers()
         self.check_project_relations()
         self.check_value_relation()
         self.check_field_names()
@@ -130,7 +147,13 @@ class MerginProjectValidator(object):
 
     def check_single_proj(self, project_dir):
         """Check if there is one and only one QGIS project in the directory."""
-        self.qgis_files = find_qgis_files(project_dir)
+        if not project_dir or not os.path.isdir(project_dir):
+            # no need to scan for project files, e.g. the directory was removed or the project was never saved
+            self.qgis_files = []
+            self.issues.append(MultipleLayersWarning(Warning.PROJ_NOT_FOUND))
+            return False
+        # there is no need to look any further once the second project file is found
+        self.qgis_files = find_qgis_files(project_dir, limit=2)
         if len(self.qgis_files) > 1:
             self.issues.append(MultipleLayersWarning(Warning.MULTIPLE_PROJS))
             return False
@@ -143,14 +166,22 @@ class MerginProjectValidator(object):
     def check_proj_loaded(self):
         """Check if the QGIS project is loaded and validate it eventually. If not, no validation is done."""
         self.qgis_proj_path = self.qgis_files[0]
-        loaded_proj_path = QgsProject.instance().absoluteFilePath()
-        is_loaded = same_dir(self.qgis_proj_path, loaded_proj_path)
+        project = QgsProject.instance()
+        is_loaded = same_dir(self.qgis_proj_path, project.absoluteFilePath())
         if not is_loaded:
             self.issues.append(MultipleLayersWarning(Warning.PROJ_NOT_LOADED))
         else:
-            self.qgis_proj = QgsProject.instance()
+            self.qgis_proj = project
         return is_loaded
 
+    def add_single_layer_warning(self, layer_id, warning, url=None):
+        """Add a warning for the layer, unless the same warning has already been reported for it."""
+        key = (layer_id, warning, url)
+        if key in self.single_layer_warnings:
+            return
+        self.single_layer_warnings.add(key)
+        self.issues.append(SingleLayerWarning(layer_id, warning, url))
+
     def check_proj_paths_relative(self):
         """Check if the QGIS project has relative paths, i.e. not absolute ones."""
         abs_paths, ok = self.qgis_proj.readEntry("Paths", "/Absolute")
@@ -161,118 +192,182 @@ class MerginProjectValidator(object):
     def get_proj_layers(self):
         """Get project layers and find those editable."""
         self.layers = self.qgis_proj.mapLayers()
-        self.editable = []
+        self.editable = set()
+        self.online_layer_ids = list()
+        self.gdal_lids = list()
+        self.ogr_lids = list()
+        vector_type = QgsMapLayerType.VectorLayer
         for lid, layer in self.layers.items():
             dp = layer.dataProvider()
+            dp_name = dp.name() if dp else None
+            if self._is_online_layer(layer, dp_name):
+                self.online_layer_ids.append(lid)
             if dp is None:
                 continue
-            self.layers_by_prov[dp.name()].append(lid)
-            if layer.type() == QgsMapLayerType.VectorLayer:
-                caps = dp.capabilities()
-                can_edit = (
-                    True
-                    if (caps & QgsVectorDataProvider.AddFeatures or caps & QgsVectorDataProvider.ChangeAttributeValues)
-                    else False
-                )
-                if can_edit:
-                    self.editable.append(layer.id())
+            if dp_name == "gdal":
+                self.gdal_lids.append(lid)
+            elif dp_name == "ogr":
+                self.ogr_lids.append(lid)
+            storage = None
+            if layer.type() == vector_type:
+                storage = dp.storageType()
+                if dp.capabilities() & EDIT_CAPABILITIES:
+                    self.editable.add(lid)
+            self.providers[lid] = (dp, dp_name, storage)
+        self.file_layer_ids = frozenset(self.gdal_lids + self.ogr_lids)
         if len(self.editable) == 0:
             self.issues.append(MultipleLayersWarning(Warning.NO_EDITABLE_LAYERS))
 
+    def check_all_layers(self):
+        """
+        Run all the checks done for each layer separately in a single pass over the project layers,
+        so that the data provider details are looked up only once per layer.
+        """
+        proj_dir = self._normalized_proj_dir()
+        for lid, layer in self.layers.items():
+            dp, dp_name, storage = self.providers.get(lid, (None, None, None))
+            if lid in self.file_layer_ids:
+                self._check_saved_in_proj_dir(lid, layer, proj_dir)
+            if lid not in self.editable:
+                continue
+            self._check_editable_vector_format(lid, storage)
+            self._check_attachment_widget(lid, layer)
+            self._check_db_schema(lid, layer, storage)
+        self._add_offline_warning(self.online_layer_ids)
+
     def check_editable_vectors_format(self):
         """Check if editable vector layers are GPKGs."""
         for lid, layer in self.layers.items():
             if lid not in self.editable:
                 continue
-            dp = layer.dataProvider()
-            if not dp.storageType() == "GPKG":
-                self.issues.append(SingleLayerWarning(lid, Warning.EDITABLE_NON_GPKG))
+            self._check_editable_vector_format(lid, layer.dataProvider().storageType())
+
+    def _check_editable_vector_format(self, lid, storage):
+        if not storage == "GPKG":
+            self.add_single_layer_warning(lid, Warning.EDITABLE_NON_GPKG)
 
     def check_saved_in_proj_dir(self):
         """Check if layers saved in project's directory."""
-        for lid, layer in self.layers.items():
-            if lid not in self.layers_by_prov["gdal"] + self.layers_by_prov["ogr"]:
-                continue
-            pub_src = layer.publicSource()
-            if pub_src.startswith("GPKG:"):
-                pub_src = pub_src[5:]
-                l_path = pub_src[: pub_src.rfind(":")]
-            else:
-                l_path = layer.publicSource().split("|")[0]
-            l_dir = os.path.dirname(l_path)
-            if not same_dir(l_dir, self.qgis_proj_dir):
-                self.issues.append(SingleLayerWarning(lid, Warning.EXTERNAL_SRC))
+        proj_dir = self._normalized_proj_dir()
+        for lid in self.gdal_lids + self.ogr_lids:
+            self._check_saved_in_proj_dir(lid, self.layers[lid], proj_dir)
+
+    def _normalized_proj_dir(self):
+        """Project directory normalized the same way as same_dir() does, so it is not repeated for every layer."""
+        if not self.qgis_proj_dir:
+            return None
+        return os.path.normcase(os.path.normpath(self.qgis_proj_dir))
+
+    def _check_saved_in_proj_dir(self, lid, layer, proj_dir):
+        pub_src = layer.publicSource()
+        if pub_src.startswith("GPKG:"):
+            # GPKG:<path>:<table>
+            l_path, sep, table = pub_src[5:].rpartition(":")
+            if not sep:
+                l_path = pub_src[5:]
+        else:
+            # strip the "|layername=..." part if present
+            sep = pub_src.find("|")
+            l_path = pub_src if sep < 0 else pub_src[:sep]
+        l_dir = os.path.dirname(l_path)
+        if not l_dir or not proj_dir or os.path.normcase(os.path.normpath(l_dir)) != proj_dir:
+            self.add_single_layer_warning(lid, Warning.EXTERNAL_SRC)
 
     def check_offline(self):
         """Check if there are layers that might not be available when offline"""
-        w = MultipleLayersWarning(Warning.NOT_FOR_OFFLINE)
+        online_layer_ids = list()
         for lid, layer in self.layers.items():
-            # special check for vector tile layers because in QGIS < 3.22 they may not have data provider assigned
-            if layer.type() == QgsMapLayerType.VectorTileLayer:
-                # mbtiles/vtpk are always local files
-                if "type=mbtiles" in layer.source() or "type=vtpk" in layer.source():
-                    continue
-                w.items.append(layer.name())
-                continue
+            dp = layer.dataProvider()
+            if self._is_online_layer(layer, dp.name() if dp else None):
+                online_layer_ids.append(lid)
+        self._add_offline_warning(online_layer_ids)
+
+    def _add_offline_warning(self, layer_ids):
+        if layer_ids:
+            w = MultipleLayersWarning(Warning.NOT_FOR_OFFLINE)
+            w.items = [self.layers[lid].name() for lid in layer_ids]
+            self.issues.append(w)
 
-            dp_name = layer.dataProvider().name()
-            if dp_name in QGIS_NET_PROVIDERS + QGIS_DB_PROVIDERS:
-                # raster tiles in mbtiles are always local files
-                if dp_name == "wms" and "type=mbtiles" in layer.source():
-                    continue
-                w.items.append(layer.name())
+    def _is_online_layer(self, layer, dp_name):
+        # special check for vector tile layers because in QGIS < 3.22 they may not have data provider assigned
+        if layer.type() == QgsMapLayerType.VectorTileLayer:
+            # mbtiles/vtpk are always local files
+            return not ("type=mbtiles" in layer.source() or "type=vtpk" in layer.source())
 
-        if w.items:
-            self.issues.append(w)
+        if dp_name in ONLINE_PROVIDERS:
+            # raster tiles in mbtiles are always local files
+            return not (dp_name == "wms" and "type=mbtiles" in layer.source())
+        return False
 
     def check_attachment_widget(self):
         """Check if attachment widget is configured correctly."""
         for lid, layer in self.layers.items():
             if lid not in self.editable:
                 continue
-            fields = layer.fields()
-            for i in range(fields.count()):
-                ws = layer.editorWidgetSetup(i)
-                if ws and ws.type() == "ExternalResource":
-                    cfg = ws.config()
-                    # check for relative paths
-                    if "RelativeStorage" in cfg and cfg["RelativeStorage"] == 0:
-                        self.issues.append(SingleLayerWarning(lid, Warning.ATTACHMENT_ABSOLUTE_PATH))
-                    if "DefaultRoot" in cfg:
-                        # default root should not be set to the local path
-                        if os.path.isabs(cfg["DefaultRoot"]):
-                            self.issues.append(SingleLayerWarning(lid, Warning.ATTACHMENT_LOCAL_PATH))
-
-                        # expression-based path should be set with the data-defined overrride
-                        expr = QgsExpression(cfg["DefaultRoot"])
-                        if expr.isValid():
-                            self.issues.append(SingleLayerWarning(lid, Warning.ATTACHMENT_EXPRESSION_PATH))
-
-                        # using hyperlinks for document path is not allowed when
-                        if "UseLink" in cfg:
-                            self.issues.append(SingleLayerWarning(lid, Warning.ATTACHMENT_HYPERLINK))
-
-                    # check that expression uses Mergin variables
-                    try:
-                        formula = cfg["PropertyCollection"]["properties"]["propertyRootPath"]["expression"]
-                        if not PROJECT_VARS.search(formula):
-                            self.issues.append(SingleLayerWarning(lid, Warning.ATTACHMENT_WRONG_EXPRESSION))
-                    except (KeyError, TypeError):
-                        continue
+            self._check_attachment_widget(lid, layer)
+
+    def _check_attachment_widget(self, lid, layer):
+        field_count = layer.fields().count()
+        if field_count == 0:
+            return
+        attachment_widgets = [
+            ws
+            for ws in (layer.editorWidgetSetup(i) for i in range(field_count))
+            if ws and ws.type() == "ExternalResource"
+        ]
+        for ws in attachment_widgets:
+            cfg = ws.config()
+            # check for relative paths
+            if cfg.get("RelativeStorage") == 0:
+                self.add_single_layer_warning(lid, Warning.ATTACHMENT_ABSOLUTE_PATH)
+            default_root = cfg.get("DefaultRoot")
+            if default_root is not None:
+                # default root should not be set to the local path
+                if os.path.isabs(default_root):
+                    self.add_single_layer_warning(lid, Warning.ATTACHMENT_LOCAL_PATH)
+
+                # expression-based path should be set with the data-defined overrride
+                is_valid = self.expressions_validity.get(default_root)
+                if is_valid is None:
+                    is_valid = QgsExpression(default_root).isValid()
+                    self.expressions_validity[default_root] = is_valid
+                if is_valid:
+                    self.add_single_layer_warning(lid, Warning.ATTACHMENT_EXPRESSION_PATH)
+
+                # using hyperlinks for document path is not allowed when
+                if "UseLink" in cfg:
+                    self.add_single_layer_warning(lid, Warning.ATTACHMENT_HYPERLINK)
+
+            # check that expression uses Mergin variables
+            try:
+                formula = cfg["PropertyCollection"]["properties"]["propertyRootPath"]["expression"]
+                if not PROJECT_VARS.search(formula):
+                    self.add_single_layer_warning(lid, Warning.ATTACHMENT_WRONG_EXPRESSION)
+            except (KeyError, TypeError):
+                continue
 
     def check_db_schema(self):
         for lid, layer in self.layers.items():
             if lid not in self.editable:
                 continue
-            dp = layer.dataProvider()
-            if dp.storageType() == "GPKG":
-                has_change, msg = has_schema_change(self.mp, layer)
-                if has_change:
-                    self.issues.append(SingleLayerWarning(lid, Warning.DATABASE_SCHEMA_CHANGE))
+            self._check_db_schema(lid, layer, layer.dataProvider().storageType())
+
+    def _check_db_schema(self, lid, layer, storage):
+        if storage == "GPKG":
+            # the whole GeoPackage schema is compared, so do it only once for all layers stored in the same file
+            pub_src = layer.publicSource()
+            sep = pub_src.find("|")
+            gpkg_path = pub_src if sep < 0 else pub_src[:sep]
+            has_change = self.schema_changes.get(gpkg_path)
+            if has_change is None:
+                has_change, _ = has_schema_change(self.mp, layer)
+                self.schema_changes[gpkg_path] = has_change
+            if has_change:
+                self.add_single_layer_warning(lid, Warning.DATABASE_SCHEMA_CHANGE)
 
     def check_project_relations(self):
         """Check if project relations configured correctly"""
-        relations = QgsProject.instance().relationManager().relations()
+        relations = self.qgis_proj.relationManager().relations()
         for name, relation in relations.items():
             parent_layer = relation.referencedLayer()
             parent_fields = relation.referencedFields()
@@ -300,12 +395,12 @@ class MerginProjectValidator(object):
                 if ws and ws.type() == "ValueRelation":
                     cfg = ws.config()
                     if "Layer" not in cfg or "Key" not in cfg:
-                        self.issues.append(SingleLayerWarning(lid, Warning.BROKEN_VALUE_RELATION_CONFIG))
+                        self.add_single_layer_warning(lid, Warning.BROKEN_VALUE_RELATION_CONFIG)
                         continue
 
                     child_layer = next((v for k, v in self.layers.items() if k == cfg["Layer"]), None)
                     if child_layer is None:
-                        self.issues.append(SingleLayerWarning(lid, Warning.VALUE_RELATION_LAYER_MISSED))
+                        self.add_single_layer_warning(lid, Warning.VALUE_RELATION_LAYER_MISSED)
                         continue
 
                     # check that "key" field does not have duplicated values
@@ -319,30 +414,30 @@ class MerginProjectValidator(object):
         feature_count = layer.dataProvider().featureCount()
         for f in fields:
             if len(layer.uniqueValues(f)) != feature_count:
-                self.issues.append(SingleLayerWarning(layer.id(), Warning.KEY_FIELD_NOT_UNIQUE))
+                self.add_single_layer_warning(layer.id(), Warning.KEY_FIELD_NOT_UNIQUE)
 
     def _check_primary_keys(self, layer, fields):
         layer_fields = layer.fields()
         keys = get_primary_keys(layer)
         for i in fields:
             if layer_fields[i].name() in keys:
-                self.issues.append(SingleLayerWarning(layer.id(), Warning.FIELD_IS_PRIMARY_KEY))
+                self.add_single_layer_warning(layer.id(), Warning.FIELD_IS_PRIMARY_KEY)
 
     def check_field_names(self):
         for lid, layer in self.layers.items():
             if lid not in self.editable:
                 continue
-            dp = layer.dataProvider()
-            if dp.storageType() == "GPKG":
+            dp, dp_name, storage = self.providers[lid]
+            if storage == "GPKG":
                 fields = layer.fields()
                 for f in fields:
                     if INVALID_CHARS.search(f.name()):
-                        self.issues.append(SingleLayerWarning(lid, Warning.INCORRECT_FIELD_NAME))
+                        self.add_single_layer_warning(lid, Warning.INCORRECT_FIELD_NAME)
 
     def check_snapping(self):
-        mode, ok = QgsProject.instance().readNumEntry("Mergin", "Snapping")
+        mode, ok = self.qgis_proj.readNumEntry("Mergin", "Snapping")
         if ok:
-            enabled = QgsProject.instance().snappingConfig().enabled()
+            enabled = self.qgis_proj.snappingConfig().enabled()
             if not enabled and mode == 2:
                 # snapping in the mobile app using QGIS setting is enbaled but QGIS snapping is not activated
                 self.issues.append(MultipleLayersWarning(Warning.QGIS_SNAPPING_NOT_ENABLED))
@@ -362,8 +457,9 @@ class MerginProjectValidator(object):
             self.issues.append(w)
 
     def check_svgs_embedded(self):
+        vector_type = QgsMapLayerType.VectorLayer
         for lid, layer in self.layers.items():
-            if layer.type() != QgsMapLayerType.VectorLayer:
+            if layer.type() != vector_type:
                 continue
 
             renderer = layer.renderer()
@@ -390,7 +486,7 @@ class MerginProjectValidator(object):
                             break
 
                 if not_embedded:
-                    self.issues.append(SingleLayerWarning(lid, Warning.SVG_NOT_EMBEDDED))
+                    self.add_single_layer_warning(lid, Warning.SVG_NOT_EMBEDDED)
                     break
 
     def check_editor_perms(self):
@@ -413,7 +509,7 @@ class MerginProjectValidator(object):
                 layer = get_layer_by_path(path)
                 if layer:
                     url = f"reset_file?layer={path}"
-                    self.issues.append(SingleLayerWarning(layer.id(), Warning.EDITOR_NON_DIFFABLE_CHANGE, url))
+                    self.add_single_layer_warning(layer.id(), Warning.EDITOR_NON_DIFFABLE_CHANGE, url)
         # editor cannot delete a versioned file (e.g. '*.gpkg')
         for file in self.changes["removed"]:
             path = file["path"]
@@ -421,67 +517,70 @@ class MerginProjectValidator(object):
                 layer = get_layer_by_path(path)
                 if layer:
                     url = f"reset_file?layer={path}"
-                    self.issues.append(SingleLayerWarning(layer.id(), Warning.EDITOR_DIFFBASED_FILE_REMOVED, url))
+                    self.add_single_layer_warning(layer.id(), Warning.EDITOR_DIFFBASED_FILE_REMOVED, url)
+
+
+_MERGIN_HELP = None
+
+
+def mergin_help():
+    """Returns MerginHelp instance shared by all warnings, created only when a help link is needed."""
+    global _MERGIN_HELP
+    if _MERGIN_HELP is None:
+        _MERGIN_HELP = MerginHelp()
+    return _MERGIN_HELP
+
+
+# display strings of the warnings which do not depend on the help pages or on the warning URL
+WARNING_DISPLAY_STRINGS = {
+    Warning.PROJ_NOT_LOADED: "The QGIS project is not loaded. Open it to allow validation",
+    Warning.PROJ_NOT_FOUND: "No QGIS project found in the directory",
+    Warning.MULTIPLE_PROJS: "Multiple QGIS project files found in the directory",
+    Warning.ABSOLUTE_PATHS: "QGIS project saves layers using absolute paths",
+    Warning.EDITABLE_NON_GPKG: "Editable layer stored in a format other than GeoPackage",
+    Warning.EXTERNAL_SRC: "Layer stored out of the project directory",
+    Warning.NO_EDITABLE_LAYERS: "No editable layers in the project",
+    Warning.ATTACHMENT_LOCAL_PATH: "Attachment widget uses local path",
+    Warning.ATTACHMENT_EXPRESSION_PATH: "Attachment widget incorrectly uses expression-based path",
+    Warning.ATTACHMENT_HYPERLINK: "Attachment widget uses hyperlink",
+    Warning.DATABASE_SCHEMA_CHANGE: "Database schema was changed",
+    Warning.KEY_FIELD_NOT_UNIQUE: "Relation key field contains duplicated values",
+    Warning.FIELD_IS_PRIMARY_KEY: "Relation uses primary key field",
+    Warning.VALUE_RELATION_LAYER_MISSED: "Referenced table is missed from the project",
+    Warning.INCORRECT_FIELD_NAME: "Field names contain line-break characters",
+    Warning.BROKEN_VALUE_RELATION_CONFIG: "Incomplete value relation configuration",
+    Warning.QGIS_SNAPPING_NOT_ENABLED: "Snapping is currently disabled in this QGIS project, it will be thus disabled in the mobile app",
+    Warning.MERGIN_SNAPPING_NOT_ENABLED: "Snapping is currently enabled in this QGIS project, but not enabled in the mobile app",
+    Warning.MISSING_DATUM_SHIFT_GRID: "Required datum shift grid is missing, reprojection may not work correctly. <a href='fix_datum_shift_grids'>Fix the issue.</a>",
+    Warning.SVG_NOT_EMBEDDED: "SVGs used for layer styling are not embedded in the project file, as a result those symbols won't be displayed in the mobile app",
+}
+
+# display strings of the warnings linking to the help pages, built from the MerginHelp instance
+HELP_WARNING_DISPLAY_STRINGS = {
+    Warning.NOT_FOR_OFFLINE: lambda help_mgr: f"Layer might not be available when offline. <a href='{help_mgr.howto_background_maps()}'>Read more.</a>",
+    Warning.ATTACHMENT_ABSOLUTE_PATH: lambda help_mgr: f"Attachment widget uses absolute paths. <a href='{help_mgr.howto_attachment_widget()}'>Read more.</a>",
+    Warning.ATTACHMENT_WRONG_EXPRESSION: lambda help_mgr: f"Expression for the default path in the attachment widget configuration might be wrong. <a href='{help_mgr.howto_attachment_widget()}'>Read more.</a>",
+}
+
+# display strings of the warnings with an action link, formatted with the warning URL
+URL_WARNING_DISPLAY_STRINGS = {
+    Warning.EDITOR_PROJECT_FILE_CHANGE: (
+        "You don't have permission to edit the QGIS project file. Your changes to this file will not be sent to the server. "
+        "Ask the workspace admin to upgrade your permission if you want your changes sent to the server. "
+        "You can also <a href='{url}'>reset this QGIS project file</a> to the server version."
+    ),
+    Warning.EDITOR_NON_DIFFABLE_CHANGE: "You don't have permission to edit layer fields and properties. Ask the workspace admin to upgrade your permission or <a href='{url}'>reset the layer</a> to be able to sync changes.",
+    Warning.EDITOR_JSON_CONFIG_CHANGE: "You don't have permission to change the configuration of this project. <a href='{url}'>Reset the configuration</a> to be able to sync data changes.",
+    Warning.EDITOR_DIFFBASED_FILE_REMOVED: "You don't have permission to remove this layer. <a href='{url}'>Reset the layer</a> to be able to sync changes.",
+}
 
 
 def warning_display_string(warning_id, url=None):
     """Returns a display string for a corresponding warning"""
-    help_mgr = MerginHelp()
-    if warning_id == Warning.PROJ_NOT_LOADED:
-        return "The QGIS project is not loaded. Open it to allow validation"
-    elif warning_id == Warning.PROJ_NOT_FOUND:
-        return "No QGIS project found in the directory"
-    elif warning_id == Warning.MULTIPLE_PROJS:
-        return "Multiple QGIS project files found in the directory"
-    elif warning_id == Warning.ABSOLUTE_PATHS:
-        return "QGIS project saves layers using absolute paths"
-    elif warning_id == Warning.EDITABLE_NON_GPKG:
-        return "Editable layer stored in a format other than GeoPackage"
-    elif warning_id == Warning.EXTERNAL_SRC:
-        return "Layer stored out of the project directory"
-    elif warning_id == Warning.NOT_FOR_OFFLINE:
-        return f"Layer might not be available when offline. <a href='{help_mgr.howto_background_maps()}'>Read more.</a>"
-    elif warning_id == Warning.NO_EDITABLE_LAYERS:
-        return "No editable layers in the project"
-    elif warning_id == Warning.ATTACHMENT_ABSOLUTE_PATH:
-        return f"Attachment widget uses absolute paths. <a href='{help_mgr.howto_attachment_widget()}'>Read more.</a>"
-    elif warning_id == Warning.ATTACHMENT_LOCAL_PATH:
-        return "Attachment widget uses local path"
-    elif warning_id == Warning.ATTACHMENT_EXPRESSION_PATH:
-        return "Attachment widget incorrectly uses expression-based path"
-    elif warning_id == Warning.ATTACHMENT_HYPERLINK:
-        return "Attachment widget uses hyperlink"
-    elif warning_id == Warning.DATABASE_SCHEMA_CHANGE:
-        return "Database schema was changed"
-    elif warning_id == Warning.KEY_FIELD_NOT_UNIQUE:
-        return "Relation key field contains duplicated values"
-    elif warning_id == Warning.FIELD_IS_PRIMARY_KEY:
-        return "Relation uses primary key field"
-    elif warning_id == Warning.VALUE_RELATION_LAYER_MISSED:
-        return "Referenced table is missed from the project"
-    elif warning_id == Warning.INCORRECT_FIELD_NAME:
-        return "Field names contain line-break characters"
-    elif warning_id == Warning.BROKEN_VALUE_RELATION_CONFIG:
-        return "Incomplete value relation configuration"
-    elif warning_id == Warning.ATTACHMENT_WRONG_EXPRESSION:
-        return "Expression for the default path in the attachment widget configuration might be wrong. <a href='{help_mgr.howto_attachment_widget()}'>Read more.</a>"
-    elif warning_id == Warning.QGIS_SNAPPING_NOT_ENABLED:
-        return "Snapping is currently disabled in this QGIS project, it will be thus disabled in the mobile app"
-    elif warning_id == Warning.MERGIN_SNAPPING_NOT_ENABLED:
-        return "Snapping is currently enabled in this QGIS project, but not enabled in the mobile app"
-    elif warning_id == Warning.MISSING_DATUM_SHIFT_GRID:
-        return "Required datum shift grid is missing, reprojection may not work correctly. <a href='fix_datum_shift_grids'>Fix the issue.</a>"
-    elif warning_id == Warning.SVG_NOT_EMBEDDED:
-        return "SVGs used for layer styling are not embedded in the project file, as a result those symbols won't be displayed in the mobile app"
-    elif warning_id == Warning.EDITOR_PROJECT_FILE_CHANGE:
-        return (
-            f"You don't have permission to edit the QGIS project file. Your changes to this file will not be sent to the server. "
-            f"Ask the workspace admin to upgrade your permission if you want your changes sent to the server. "
-            f"You can also <a href='{url}'>reset this QGIS project file</a> to the server version."
-        )
-    elif warning_id == Warning.EDITOR_NON_DIFFABLE_CHANGE:
-        return f"You don't have permission to edit layer fields and properties. Ask the workspace admin to upgrade your permission or <a href='{url}'>reset the layer</a> to be able to sync changes."
-    elif warning_id == Warning.EDITOR_JSON_CONFIG_CHANGE:
-        return f"You don't have permission to change the configuration of this project. <a href='{url}'>Reset the configuration</a> to be able to sync data changes."
-    elif warning_id == Warning.EDITOR_DIFFBASED_FILE_REMOVED:
-        return f"You don't have permission to remove this layer. <a href='{url}'>Reset the layer</a> to be able to sync changes."
+    display_string = WARNING_DISPLAY_STRINGS.get(warning_id)
+    if display_string is not None:
+        return display_string
+    if warning_id in HELP_WARNING_DISPLAY_STRINGS:
+        return HELP_WARNING_DISPLAY_STRINGS[warning_id](mergin_help())
+    if warning_id in URL_WARNING_DISPLAY_STRINGS:
+        return URL_WARNING_DISPLAY_STRINGS[warning_id].format(url=url)
@@ -3,7 +3,9 @@
 
 import math
 import os
+import sqlite3
 import sys
+import time
 
 from qgis.core import (
     QgsApplication,  # Used to filter background map
@@ -27,15 +29,18 @@ except ImportError:
 
 
 from qgis.gui import QgsAttributeTableFilterModel, QgsAttributeTableModel, QgsGui, QgsMapToolPan
-from qgis.PyQt import QtCore, uic
+from qgis.PyQt import uic
 from qgis.PyQt.QtCore import (
     QAbstractTableModel,
     QItemSelectionModel,
     QModelIndex,
+    QObject,
+    QRunnable,
     QSettings,
-    QStringListModel,
     Qt,
     QThread,
+    QThreadPool,
+    QTimer,
     pyqtSignal,
 )
 from qgis.PyQt.QtGui import QColor, QFont, QIcon, QStandardItem, QStandardItemModel
@@ -56,7 +61,6 @@ from .mergin import MerginClient
 from .mergin.merginproject import MerginProject
 from .mergin.utils import bytes_to_human_size, int_version
 from .utils import (
-    PROJS_PER_PAGE,
     ClientError,
     contextual_date,
     format_datetime,
@@ -70,19 +74,45 @@ from .utils import (
 
 ui_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "ui_versions_viewer.ui")
 
+# Maximum number of version pages requested from the server at the same time
+MAX_INFLIGHT_FETCHES = 3
+
+# Bounds of the number of versions requested in one page
+MIN_VERSIONS_PER_PAGE = 50
+MAX_VERSIONS_PER_PAGE = 100  # server limit
+# Page request time (ms) above which the connection is considered slow and more pages are prefetched
+SLOW_REQUEST_MS = 50
+# Fetched versions are passed to the view in chunks of this size so it can repaint in between
+VERSIONS_CHUNK_SIZE = 20
+# Scrolling speed (viewports per second) for which one more page is prefetched ahead
+FAST_SCROLL_SPEED = 2
+
 
 class VersionsTableModel(QAbstractTableModel):
     VERSION = Qt.UserRole + 1
     VERSION_NAME = Qt.UserRole + 2
 
+    HANDLED_ROLES = frozenset(
+        (Qt.DisplayRole, Qt.TextAlignmentRole, Qt.FontRole, Qt.ToolTipRole, VERSION, VERSION_NAME)
+    )
+    # keys of the version row shown in the columns
+    DISPLAY_KEYS = ("name", "author", "_created_display")
+
+    # shared by all rows showing the local version, created on first use
+    _bold_font = None
+
+    # the view asks for more rows, versions are fetched by the dialog
+    fetch_requested = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # Keep ordered
         self.versions = []
 
-        self.oldest = None
-        self.latest = None
+        # version numbers of the first and last row, updated as rows are added
+        self._latest_int = None
+        self._oldest_int = None
 
         self.headers = ["Version", "Author", "Created"]
 
@@ -91,14 +121,19 @@ class VersionsTableModel(QAbstractTableModel):
         self._loading = False
 
     def latest_version(self):
-        if not self.versions:
-            return None
-        return int_version(self.versions[0]["name"])
+        return self._latest_int
 
     def oldest_version(self):
-        if not self.versions:
-            return None
-        return int_version(self.versions[-1]["name"])
+        return self._oldest_int
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if parent.isValid():
+            return False
+        # versions are numbered from v1, nothing more to fetch once it is loaded
+        return self._oldest_int is None or self._oldest_int > 1
+
+    def fetchMore(self, parent: QModelIndex):
+        self.fetch_requested.emit()
 
     def rowCount(self, parent: QModelIndex = QModelIndex):
         # We add an extra row when loading
@@ -113,72 +148,85 @@ class VersionsTableModel(QAbstractTableModel):
         return None
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid():
+        # views query many roles for each cell, leave early for those we don't provide
+        if role not in self.HANDLED_ROLES or not index.isValid():
             return None
 
         idx = index.row()
+        column = index.column()
 
         # Edge case last row when loading
-        if index.row() >= len(self.versions):
-            if role == Qt.DisplayRole:
-                if index.column() == 0:
-                    return "loading..."
-            return
+        if idx >= len(self.versions):
+            if role == Qt.DisplayRole and column == 0:
+                return "loading..."
+            return None
+        version = self.versions[idx]
         if role == Qt.DisplayRole:
-            if index.column() == 0:
-                if self.versions[idx]["name"] == self.current_version:
-                    return f'{self.versions[idx]["name"]} (local)'
-                return self.versions[idx]["name"]
-            if index.column() == 1:
-                return self.versions[idx]["author"]
-            if index.column() == 2:
-                return contextual_date(self.versions[idx]["created"])
+            if column == 0 and version["name"] == self.current_version:
+                return f'{version["name"]} (local)'
+            return version[self.DISPLAY_KEYS[column]]
         elif role == Qt.TextAlignmentRole:
-            if index.column() == 0:
+            if column == 0:
                 return Qt.AlignLeft
         elif role == Qt.FontRole:
-            if self.versions[idx]["name"] == self.current_version:
-                font = QFont()
-                font.setBold(True)
-                return font
+            if version["name"] == self.current_version:
+                if VersionsTableModel._bold_font is None:
+                    VersionsTableModel._bold_font = QFont()
+                    VersionsTableModel._bold_font.setBold(True)
+                return VersionsTableModel._bold_font
         elif role == Qt.ToolTipRole:
-            return f"""Version: {self.versions[idx]['name'] }
-Author: {self.versions[idx]['author']}
-Date: {format_datetime(self.versions[idx]['created'])}"""
+            return f"""Version: {version['name'] }
+Author: {version['author']}
+Date: {format_datetime(version['created'])}"""
         elif role == VersionsTableModel.VERSION:
-            return int_version(self.versions[idx]["name"])
+            return version["_int_version"]
         elif role == VersionsTableModel.VERSION_NAME:
-            return self.versions[idx]["name"]
-        else:
-            return None
+            return version["name"]
+        return None
 
     def clear(self):
         self.beginResetModel()
         self.versions.clear()
+        self._latest_int = None
+        self._oldest_int = None
         self.endResetModel()
 
     def append_versions(self, versions):
-        first_row = len(self.versions) - 1
-        last_row = first_row + len(versions)
+        for v in versions:
+            v["_int_version"] = int_version(v["name"])
+        # pages shift when new versions are pushed while browsing the history, skip those we already have
+        if self._oldest_int is not None:
+            versions = [v for v in versions if v["_int_version"] < self._oldest_int]
+        if not versions:
+            return
+        # data() is called for every visible cell on each repaint, so compute derived values only once
+        for v in versions:
+            v["_created_display"] = contextual_date(v["created"])
+        # new rows go before the "loading..." row
+        first_row = len(self.versions)
+        last_row = first_row + len(versions) - 1
         self.beginInsertRows(QModelIndex(), first_row, last_row)
         self.versions.extend(versions)
+        if self._latest_int is None:
+            self._latest_int = versions[0]["_int_version"]
+        self._oldest_int = versions[-1]["_int_version"]
         self.endInsertRows()
 
-        self.layoutChanged.emit()
-
     def beginFetching(self):
-        first_row = self.rowCount() - 1
-        last_row = first_row + 1
-        self.beginInsertRows(QModelIndex(), first_row, last_row)
-        self.endInsertRows()
+        if self._loading:
+            return
+        loading_row = len(self.versions)
+        self.beginInsertRows(QModelIndex(), loading_row, loading_row)
         self._loading = True
+        self.endInsertRows()
 
     def endFetching(self):
-        first_row = self.rowCount() - 1
-        last_row = first_row + 1
-        self.beginRemoveRows(QModelIndex(), first_row, last_row)
-        self.endRemoveRows()
+        if not self._loading:
+            return
+        loading_row = len(self.versions)
+        self.beginRemoveRows(QModelIndex(), loading_row, loading_row)
         self._loading = False
+        self.endRemoveRows()
 
     def item_from_index(self, index: QModelIndex):
         return self.versions[index.row()]
@@ -251,40 +299,145 @@ class ChangesetsDownloader(QThread):
         self.finished.emit("")
 
 
-class VersionsFetcher(QThread):
+class VersionsCache:
+    """
+    Local cache of the project versions list. Versions never change once created,
+    so cached rows are never invalidated.
+    """
+
+    def __init__(self, path):
+        """
+        VersionsCache constructor
+
+        :param path: path to the cache sqlite database, created when needed
+        """
+        self.path = path
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS versions (version INTEGER PRIMARY KEY, name TEXT, author TEXT, created TEXT)"
+        )
+        return conn
+
+    def insert_versions(self, versions):
+        rows = [(int_version(v["name"]), v["name"], v["author"], v["created"]) for v in versions]
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?)", rows)
+            conn.close()
+        except (sqlite3.Error, OSError) as e:
+            QgsMessageLog.logMessage(f"Failed to cache project versions: {str(e)}", "Mergin")
+
+    def versions_below(self, version):
+        """Returns cached versions older than the given one, latest first, up to the first version not in cache"""
+        try:
+            conn = self._connect()
+            # usually the preceding version is not cached yet, don't read the older rows for nothing then
+            if conn.execute("SELECT 1 FROM versions WHERE version = ?", (version - 1,)).fetchone() is None:
+                rows = []
+            else:
+                rows = conn.execute(
+                    "SELECT version, name, author, created FROM versions WHERE version < ? ORDER BY version DESC",
+                    (version,),
+                ).fetchall()
+            conn.close()
+        except (sqlite3.Error, OSError) as e:
+            QgsMessageLog.logMessage(f"Failed to read cached project versions: {str(e)}", "Mergin")
+            return []
+
+        versions = []
+        expected = version - 1
+        for number, name, author, created in rows:
+            if number != expected:
+                break
+            versions.append({"name": name, "author": author, "created": created})
+            expected -= 1
+        return versions
+
+
+class VersionsFetcherSignals(QObject):
+    """
+    Signals of VersionsFetcher, QRunnable is not a QObject so it can't have its own
+    """
+
+    chunk_ready = pyqtSignal(int, list)
+    # page, number of versions in the project, request time in ms
+    finished = pyqtSignal(int, int, int)
+    error_occured = pyqtSignal(int, Exception)
 
-    finished = pyqtSignal()
 
-    def __init__(self, mc: MerginClient, project_path, model: VersionsTableModel):
+class VersionsFetcher(QRunnable):
+    """
+    Class to fetch one page of project versions in a thread pool worker thread
+    """
+
+    def __init__(self, mc: MerginClient, project_path, page, per_page, cache: VersionsCache):
+        """
+        VersionsFetcher constructor
+
+        :param mc: MerginClient instance
+        :param project_path: full project name
+        :param page: page of versions to fetch, pages are ordered from the latest version
+        :param per_page: number of versions per page
+        :param cache: VersionsCache where the fetched versions are stored
+        """
         super(VersionsFetcher, self).__init__()
         self.mc = mc
         self.project_path = project_path
-        self.model = model
+        self.page = page
+        self.per_page = per_page
+        self.cache = cache
+        self.signals = VersionsFetcherSignals()
 
-        self.current_page = 1
-        self.per_page = 50
+    def run(self):
+        # the response carries the total number of versions too, so no separate request is needed for it
+        start = time.monotonic()
+        try:
+            page_versions, version_count = self.mc.paginated_project_versions(
+                self.project_path, self.page, per_page=self.per_page, descending=True
+            )
+        except ClientError as e:
+            self.signals.error_occured.emit(self.page, e)
+            return
+        # 1 ms floor, requests to localhost can be measured as 0
+        request_ms = max(1, round((time.monotonic() - start) * 1000))
+        self.cache.insert_versions(page_versions)
+        for i in range(0, len(page_versions), VERSIONS_CHUNK_SIZE):
+            self.signals.chunk_ready.emit(self.page, page_versions[i : i + VERSIONS_CHUNK_SIZE])
+        self.signals.finished.emit(self.page, version_count, request_ms)
 
-        version_count = self.mc.project_versions_count(self.project_path)
-        self.nb_page = math.ceil(version_count / self.per_page)
 
-    def run(self):
-        self.fetch_another_page()
-        self.finished.emit()
+class PermissionsCheckerSignals(QObject):
+    """
+    Signals of PermissionsChecker
+    """
 
-    def has_more_page(self):
-        return self.current_page <= self.nb_page
+    # whether the history can be viewed
+    finished = pyqtSignal(bool)
 
-    def fetch_another_page(self):
-        if self.has_more_page() == False:
-            return
-        self.model.beginFetching()
-        page_versions, _ = self.mc.paginated_project_versions(
-            self.project_path, self.current_page, per_page=self.per_page, descending=True
-        )
-        self.model.endFetching()
-        self.model.append_versions(page_versions)
 
-        self.current_page += 1
+class PermissionsChecker(QRunnable):
+    """
+    Class to check in a thread pool worker thread whether the workspace plan allows viewing the project history
+    """
+
+    def __init__(self, mc: MerginClient, ws_id):
+        super(PermissionsChecker, self).__init__()
+        self.mc = mc
+        self.ws_id = ws_id
+        self.signals = PermissionsCheckerSignals()
+
+    def run(self):
+        try:
+            usage = self.mc.workspace_usage(self.ws_id)
+            allowed = usage["view_history"]["allowed"]
+        except (ClientError, KeyError):
+            # Some versions e.g CE, EE edition doesn't have
+            allowed = True
+        self.signals.finished.emit(allowed)
 
 
 class VersionViewerDialog(QDialog):
@@ -306,31 +459,60 @@ class VersionViewerDialog(QDialog):
 
             self.mc = mc
 
-            self.failed_to_fetch = False
-
             self.project_path = mergin_project_local_path()
             self.mp = MerginProject(self.project_path)
+            self.project_full_name = self.mp.project_full_name()
 
             self.set_splitters_state()
 
             self.versionModel = VersionsTableModel()
+            self.versionModel.fetch_requested.connect(self.fetch_from_server)
             self.history_treeview.setModel(self.versionModel)
+            # all rows are a single line of text, so the view does not need to measure each inserted row
+            self.history_treeview.setUniformRowHeights(True)
             self.history_treeview.verticalScrollBar().valueChanged.connect(self.on_scrollbar_changed)
+            self._last_scroll_value = 0
+            self._last_scroll_time = time.monotonic()
+            # scrollbar moves are handled at most once per frame
+            self._pending_scroll_value = 0
+            self._scroll_timer = QTimer(self)
+            self._scroll_timer.setSingleShot(True)
+            self._scroll_timer.setInterval(16)
+            self._scroll_timer.timeout.connect(self._process_scroll)
 
             self.selectionModel: QItemSelectionModel = self.history_treeview.selectionModel()
             self.selectionModel.currentChanged.connect(self.selected_version_changed)
 
-            self.has_selected_latest = False
+            self.per_page = self.versions_per_page()
+            # on slow connections one more page is always requested ahead to hide the round-trip time
+            request_ms = QSettings().value("Mergin/versionsRequestTime", 0, int)
+            self.min_prefetch_depth = 2 if request_ms > SLOW_REQUEST_MS else 1
+            # worker threads are reused between the page requests
+            self.fetcher_pool = QThreadPool(self)
+            self.fetcher_pool.setMaxThreadCount(MAX_INFLIGHT_FETCHES)
+            # {page: VersionsFetcherSignals} of requests currently running, the fetcher itself is owned by the pool
+            self.fetchers = {}
+            # pages can arrive out of order, keep their chunks {page: [versions]} until all the preceding pages are shown
+            self.fetched_pages = {}
+            self.completed_pages = set()
+            self.next_page = 1
+            self.next_page_to_insert = 1
+            # pages which are being fetched or were already fetched
+            self.requested_pages = set()
+            # pages whose request failed, they are requested again on the next fetch
+            self.failed_pages = []
+            # total number of versions and pages is known once the first page arrives
+            self.version_count = None
+            self.nb_page = None
+            self.versions_cache = VersionsCache(os.path.join(self.mp.cache_dir, "versions.sqlite"))
+
+            self.diff_downloader = None
+
+            # the latest version is selected once both the first page is shown and the permissions are checked
+            self.permissions_ok = False
+            self.first_page_shown = False
 
-            try:
-                self.fetcher = VersionsFetcher(self.mc, self.mp.project_full_name(), self.versionModel)
-                self.fetcher.finished.connect(lambda: self.on_finish_fetching())
-                self.diff_downloader = None
-
-                self.fetch_from_server()
-            except ClientError as e:
-                self.failed_to_fetch = True
-                return
+            self.fetch_from_server()
 
             height = 30
             self.toolbar.setMinimumHeight(height)
@@ -414,29 +596,36 @@ class VersionViewerDialog(QDialog):
             self.versionModel.current_version = self.mp.version()
 
     def exec(self):
-        if self.failed_to_fetch:
-            msg = f"Client error : Failed to reach history version for project {self.project_path}"
-            QMessageBox.critical(None, "Failed requesting history", msg, QMessageBox.Close)
-            return
         try:
             ws_id = self.mp.workspace_id()
         except ClientError as e:
             QMessageBox.warning(None, "Client Error", str(e))
             return
 
-        # check if user has permissions
-        try:
-            usage = self.mc.workspace_usage(ws_id)
-            if not usage["view_history"]["allowed"]:
-                QMessageBox.warning(
-                    None, "Upgrade required", "To view the project history, please upgrade your subscription plan."
-                )
-                return
-        except ClientError:
-            # Some versions e.g CE, EE edition doesn't have
-            pass
+        # check if user has permissions, the history is not accessible until the server answers
+        self.history_treeview.setEnabled(False)
+        self.window_title = self.windowTitle()
+        self.setWindowTitle(f"{self.window_title} - Checking permissions…")
+        checker = PermissionsChecker(self.mc, ws_id)
+        checker.signals.finished.connect(self.on_permissions_checked)
+        self.fetcher_pool.start(checker)
         super().exec()
 
+    def on_permissions_checked(self, allowed):
+        if not self.isVisible():
+            # the dialog was closed meanwhile, e.g. the history failed to load
+            return
+        if not allowed:
+            QMessageBox.warning(
+                None, "Upgrade required", "To view the project history, please upgrade your subscription plan."
+            )
+            self.reject()
+            return
+        self.setWindowTitle(self.window_title)
+        self.history_treeview.setEnabled(True)
+        self.permissions_ok = True
+        self.show_first_page()
+
     def closeEvent(self, event):
         self.save_splitters_state()
         QDialog.closeEvent(self, event)
@@ -467,33 +656,163 @@ class VersionViewerDialog(QDialog):
             self.splitter_map_table.setSizes([height, height])
 
     def fetch_from_server(self):
+        if len(self.fetchers) >= MAX_INFLIGHT_FETCHES:
+            return
+        if self.versionModel.oldest_version() == 1:
+            # the whole history is shown already
+            return
 
-        if self.fetcher and self.fetcher.isRunning():
-            # Only fetching when previous is finshed
+        if self.failed_pages:
+            page = self.failed_pages.pop(0)
+        elif self.nb_page is None and self.next_page > 1:
+            # wait for the first page to learn how many pages there are
+            return
+        elif self.nb_page is not None and self.next_page > self.nb_page:
             return
         else:
-            self.fetcher.start()
+            page = self.next_page
+            self.next_page += 1
+
+        if page in self.requested_pages:
+            return
+        self.requested_pages.add(page)
+
+        if not self.fetchers:
+            self.versionModel.beginFetching()
+
+        fetcher = VersionsFetcher(self.mc, self.project_full_name, page, self.per_page, self.versions_cache)
+        fetcher.signals.chunk_ready.connect(self.on_chunk_fetched)
+        fetcher.signals.finished.connect(self.on_finish_fetching)
+        fetcher.signals.error_occured.connect(self.on_fetching_error)
+        self.fetchers[page] = fetcher.signals
+        self.fetcher_pool.start(fetcher)
+
+    def versions_per_page(self):
+        """
+        Number of versions requested in one page. Can be set in "Mergin/versionsPerPage" setting,
+        otherwise the biggest page the server allows is used.
+        """
+        per_page = QSettings().value("Mergin/versionsPerPage", 0, int)
+        if not per_page:
+            per_page = MAX_VERSIONS_PER_PAGE
+        return max(MIN_VERSIONS_PER_PAGE, min(per_page, MAX_VERSIONS_PER_PAGE))
+
+    def _release_fetcher(self, page):
+        self.fetchers.pop(page)
+        if not self.fetchers:
+            self.versionModel.endFetching()
+
+    def on_fetching_error(self, page, e: Exception):
+        self._release_fetcher(page)
+        QgsMessageLog.logMessage(f"Failed to fetch project versions: {str(e)}", "Mergin")
+        if page == 1 and self.nb_page is None:
+            msg = f"Client error : Failed to reach history version for project {self.project_path}"
+            QMessageBox.critical(None, "Failed requesting history", msg, QMessageBox.Close)
+            self.reject()
+            return
+        self.requested_pages.discard(page)
+        self.failed_pages.append(page)
+        self.failed_pages.sort()
+
+    def on_chunk_fetched(self, page, versions):
+        self.fetched_pages.setdefault(page, []).append(versions)
+        self.insert_fetched_pages()
+
+    def insert_fetched_pages(self):
+        """Show fetched versions in order, a page is shown only after all the preceding pages"""
+        while True:
+            for chunk in self.fetched_pages.pop(self.next_page_to_insert, []):
+                self.versionModel.append_versions(chunk)
+            if self.next_page_to_insert not in self.completed_pages:
+                break
+            self.completed_pages.remove(self.next_page_to_insert)
+            self.next_page_to_insert += 1
+
+    def extend_from_cache(self):
+        """Show cached versions following the oldest shown one and skip the pages they cover"""
+        oldest = self.versionModel.oldest_version()
+        if oldest is None:
+            return
+        cached = self.versions_cache.versions_below(oldest)
+        if not cached:
+            return
+        # the whole history may be cached, insert it in chunks like the fetched versions
+        for i in range(0, len(cached), VERSIONS_CHUNK_SIZE):
+            self.versionModel.append_versions(cached[i : i + VERSIONS_CHUNK_SIZE])
+
+        oldest = self.versionModel.oldest_version()
+        if oldest == 1:
+            # nothing left to fetch
+            return
+        # continue with the page containing the version preceding the oldest cached one
+        page = (self.version_count - (oldest - 1)) // self.per_page + 1
+        for skipped_page in range(self.next_page, page):
+            self.requested_pages.add(skipped_page)
+            self.completed_pages.add(skipped_page)
+        self.next_page = max(self.next_page, page)
+
+    def on_finish_fetching(self, page, version_count, request_ms):
+        self._release_fetcher(page)
+        if page == 1:
+            # adapt the prefetching to the measured timing, remember it for the next time too
+            self.min_prefetch_depth = 2 if request_ms > SLOW_REQUEST_MS else 1
+            QSettings().setValue("Mergin/versionsRequestTime", request_ms)
+        self.version_count = version_count
+        self.nb_page = math.ceil(version_count / self.per_page)
+
+        self.completed_pages.add(page)
+        is_first_page = self.next_page_to_insert == 1
+        self.insert_fetched_pages()
+        self.extend_from_cache()
 
-    def on_finish_fetching(self):
         # Fetch more if there is no scrollbar yet
         if not self.history_treeview.verticalScrollBar().isVisible():
             self.fetch_from_server()
 
-        # Action we do only on the first fetch
-        #  * resizing the column at the end of the first fetch to fit the text
-        #  * set current selected version to latest server version
-        # Nb current page is increment on each fetch so we check for 2n page
-        if self.fetcher.current_page == 2:
-            self.history_treeview.resizeColumnToContents(0)
+        if is_first_page and self.next_page_to_insert > 1:
+            self.first_page_shown = True
+            self.show_first_page()
 
-            first_row_index = self.history_treeview.model().index(0, 1, QModelIndex())
-            self.selectionModel.setCurrentIndex(
-                first_row_index, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
-            )
+    def show_first_page(self):
+        """
+        Action we do only on the first fetch, once the user is known to be allowed to view the history
+        (selecting a version downloads its details and changes):
+         * resizing the column at the end of the first fetch to fit the text
+         * set current selected version to latest server version
+        """
+        if not (self.permissions_ok and self.first_page_shown):
+            return
+        self.history_treeview.resizeColumnToContents(0)
 
-    def on_scrollbar_changed(self, value):
+        first_row_index = self.history_treeview.model().index(0, 1, QModelIndex())
+        self.selectionModel.setCurrentIndex(
+            first_row_index, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+        )
 
-        if self.ui.history_treeview.verticalScrollBar().maximum() <= value:
+    def on_scrollbar_changed(self, value):
+        self._pending_scroll_value = value
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
+    def _process_scroll(self):
+        value = self._pending_scroll_value
+        scrollbar = self.ui.history_treeview.verticalScrollBar()
+        page_step = max(1, scrollbar.pageStep())
+
+        # scrolling speed in viewports per second, negative when scrolling up
+        now = time.monotonic()
+        speed = (value - self._last_scroll_value) / page_step / max(now - self._last_scroll_time, 0.001)
+        self._last_scroll_value = value
+        self._last_scroll_time = now
+
+        # Start fetching the next page when we are one viewport away from the bottom,
+        # so it is already on its way by the time the user reaches the end of the list
+        if scrollbar.maximum() - value > page_step:
+            return
+        # the faster the user scrolls down the more pages we request ahead,
+        # only the next one when scrolling slowly or back up (two on slow connections)
+        depth = max(self.min_prefetch_depth, min(round(speed / FAST_SCROLL_SPEED), MAX_INFLIGHT_FETCHES))
+        for _ in range(depth):
             self.fetch_from_server()
 
     def selected_version_changed(self, current_index: QModelIndex, previous_index):